@@ -8,7 +8,12 @@ import logging
 
 
 class CrossoverBase(metaclass=abc.ABCMeta):
-    """Base class for crossover plugins."""
+    """Base class for crossover plugins.
+
+    Population is a C-contiguous 2D array, shape n_individuals x n_chromosomes,
+    so each individual is one contiguous row and row copies/swaps are a single memcpy.
+
+    """
 
     def __init__(self):
         logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -12,11 +12,12 @@ from pangadfs.misc import diversity, parents
 
 class CrossoverDefault(CrossoverBase):
 
-    def _diverse(self, *, population: np.ndarray, **kwargs) -> np.ndarray:
+    def _diverse(self, *, population: np.ndarray, rng: np.random.Generator = None, **kwargs) -> np.ndarray:
         """Diverse crossover of individuals in population.
         
         Args:
             population (np.ndarray): the population to crossover. Shape is n_individuals x n_chromosomes.
+            rng (np.random.Generator): the random generator, default creates a new one
             **kwargs: Arbitrary keyword arguments
 
         Returns:
@@ -26,9 +27,11 @@ class CrossoverDefault(CrossoverBase):
         # crosses over individuals with least common elements
         # step one is to get diversity matrix
         # then get indices of the minimum of each row (randomize selection among duplicates)
+        if rng is None:
+            rng = np.random.default_rng()
         diversity_matrix = diversity(population)
-        cxidx = np.argmax(np.random.random(diversity_matrix.shape) * (diversity_matrix == diversity_matrix.min()), axis=1)
-        choice = np.random.randint(2, size=diversity_matrix.size).reshape(diversity_matrix.shape).astype(bool)   
+        cxidx = np.argmax(rng.random(diversity_matrix.shape) * (diversity_matrix == diversity_matrix.min()), axis=1)
+        choice = rng.integers(2, size=diversity_matrix.shape, dtype=bool)
         return np.where(choice, diversity_matrix, cxidx)
 
     def _one_point(self, *, population: np.ndarray, point: int = 3, **kwargs) -> np.ndarray:
@@ -43,10 +46,13 @@ class CrossoverDefault(CrossoverBase):
             np.ndarray: concatenation of two offspring
 
         """
+        # offspring starts as copy of parents, then swap the tails in place
         fathers, mothers = parents(population)
-        child1 = np.hstack((fathers[:, 0:point], mothers[:, point:]))
-        child2 = np.hstack((mothers[:, 0:point], fathers[:, point:]))
-        return np.vstack((child1, child2))
+        size = len(fathers)
+        offspring = np.concatenate((fathers, mothers))
+        offspring[:size, point:] = mothers[:, point:]
+        offspring[size:, point:] = fathers[:, point:]
+        return offspring
 
     def _two_point(self, *, population: np.ndarray, points: Tuple[int] = (3, 7), **kwargs) -> np.ndarray:
         """Crosses over individuals in population at two points.
@@ -60,30 +66,37 @@ class CrossoverDefault(CrossoverBase):
             np.ndarray: concatenation of two offspring
 
         """
+        # offspring starts as copy of parents, then swap the middle in place
         fathers, mothers = parents(population)
+        size = len(fathers)
         point1, point2 = points
-        child1 = np.hstack((fathers[:, 0:point1], 
-                            mothers[:, point1:point2],
-                            fathers[:, point2:]))
-        child2 = np.hstack((mothers[:, 0:point1], 
-                            fathers[:, point1:point2],
-                            mothers[:, point2:]))
-        return np.vstack((child1, child2))
-
-    def _uniform(self, *, population: np.ndarray, **kwargs) -> np.ndarray:
+        offspring = np.concatenate((fathers, mothers))
+        offspring[:size, point1:point2] = mothers[:, point1:point2]
+        offspring[size:, point1:point2] = fathers[:, point1:point2]
+        return offspring
+
+    def _uniform(self, *, population: np.ndarray, rng: np.random.Generator = None, **kwargs) -> np.ndarray:
         """Uniform crossover of individuals in population.
         
         Args:
             population (np.ndarray): the population to crossover. Shape is n_individuals x n_chromosomes.
+            rng (np.random.Generator): the random generator, default creates a new one
             **kwargs: Arbitrary keyword arguments
 
         Returns:
             np.ndarray: concatenation of two offspring
 
         """     
+        if rng is None:
+            rng = np.random.default_rng()
+        # offspring starts as copy of parents, then swap genes where swap is True
         fathers, mothers = parents(population)
-        choice = np.random.randint(2, size=fathers.size).reshape(fathers.shape).astype(bool)   
-        return np.vstack((np.where(choice, fathers, mothers), np.where(choice, mothers, fathers)))
+        size = len(fathers)
+        swap = rng.integers(2, size=fathers.shape, dtype=bool)
+        offspring = np.concatenate((fathers, mothers))
+        np.copyto(offspring[:size], mothers, where=swap)
+        np.copyto(offspring[size:], fathers, where=swap)
+        return offspring
 
     def crossover(self, *, population: np.ndarray, method: str = 'uniform', **kwargs) -> np.ndarray:
         """Crossover individuals in population.
@@ -97,6 +110,9 @@ class CrossoverDefault(CrossoverBase):
             np.ndarray: concatenation of two offspring
 
         """     
+        # crossover methods copy and swap whole rows or column blocks
+        # this is a no-op if population is already C-contiguous
+        population = np.ascontiguousarray(population)
         dispatch = {
             'uniform': self._uniform,
             'diverse': self._diverse,
@@ -3,6 +3,8 @@
 # Copyright (C) 2020 Eric Truett
 # Licensed under the MIT License
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
 from pangadfs.base import FitnessBase
@@ -10,22 +12,66 @@ from pangadfs.base import FitnessBase
 
 class FitnessDefault(FitnessBase):
 
+    def __init__(self):
+        super().__init__()
+        self._buffer = None
+
+    def _gather_buffer(self, population: np.ndarray, points: np.ndarray) -> np.ndarray:
+        """Reusable buffer for points gathered by population
+        
+        Args:
+            population (np.ndarray): the population to assess fitness
+            points (np.ndarray): 1D array of projected points in same order as pool
+
+        Returns:
+            np.ndarray: same shape as population, same dtype as points
+
+        """
+        # kept across generations and only reallocated when population outgrows it
+        if self._buffer is None or self._buffer.size < population.size or self._buffer.dtype != points.dtype:
+            self._buffer = np.empty(population.size, dtype=points.dtype)
+        return self._buffer[:population.size].reshape(population.shape)
+
     def fitness(self,
                 *, 
                 population: np.ndarray, 
                 points: np.ndarray,
+                n_jobs: int = 1,
                 **kwargs):
         """Assesses population fitness using supplied mapping
         
         Args:
             population (np.ndarray): the population to assess fitness
             points (np.ndarray): 1D array of projected points in same order as pool
+            n_jobs (int): number of threads to split population across, default 1
             **kwargs: Arbitrary keyword arguments
 
         Returns:
-            np.ndarray: 1D array of float
+            np.ndarray: 1D array of float32
 
         """
-        return np.sum(points[population], axis=1)
+        # score in float32
+        points = np.ascontiguousarray(points, dtype=np.float32)
+
+        # gather from contiguous rows
+        population = np.ascontiguousarray(population)
+
+        # check bounds once, so np.take can skip its own check with mode='wrap'
+        if population.size and (population.min() < 0 or population.max() >= len(points)):
+            raise IndexError(f'population has player ids outside of points (0 to {len(points) - 1})')
+        gathered = self._gather_buffer(population, points)
+
+        # numpy releases the GIL in take and sum, so chunks run in parallel threads
+        if n_jobs > 1:
+            def _chunk_fitness(rows):
+                np.take(points, population[rows], out=gathered[rows], mode='wrap')
+                return np.sum(gathered[rows], axis=1)
 
+            bounds = np.linspace(0, len(population), n_jobs + 1, dtype=int)
+            with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+                return np.concatenate(list(executor.map(
+                    _chunk_fitness, [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+                )))
 
+        np.take(points, population, out=gathered, mode='wrap')
+        return np.sum(gathered, axis=1)
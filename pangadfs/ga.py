@@ -5,7 +5,7 @@
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, Iterable, Union
+from typing import Any, Callable, Dict, Iterable, List, Union
 
 import numpy as np
 import pandas as pd
@@ -50,10 +50,53 @@ class GeneticAlgorithm:
         self.driver_managers = driver_managers if driver_managers else {}
         self.extension_managers = extension_managers if extension_managers else {}
 
+        # bound driver and extension methods, resolved on first use (see _driver, _extensions)
+        self._drivers = {}
+        self._extension_methods = {}
+
         # if use_defaults, then load default plugin(s) for missing namespaces
         if use_defaults:
             self._load_plugins()
 
+    def _driver(self, ns: str):
+        """Gets bound method of the driver plugin for namespace
+
+        Args:
+            ns (str): the plugin namespace, which is also the method name
+
+        Returns:
+            Callable or None if there is no driver for namespace
+
+        """
+        # cached per manager so the generation loop skips the stevedore lookup
+        # replacing driver_managers[ns] invalidates the cached method
+        if (mgr := self.driver_managers.get(ns)) is None:
+            return None
+        cached = self._drivers.get(ns)
+        if cached is None or cached[0] is not mgr:
+            cached = self._drivers[ns] = (mgr, getattr(mgr.driver, ns))
+        return cached[1]
+
+    def _extensions(self, ns: str) -> List[Callable]:
+        """Gets bound methods of the extension plugins for namespace
+
+        Args:
+            ns (str): the plugin namespace, which is also the method name
+
+        Returns:
+            List[Callable]: in extension manager order, empty if no extensions for namespace
+
+        """
+        # plugins without the method are dropped once per manager
+        # rather than tried and skipped with try/except on every call
+        if (mgr := self.extension_managers.get(ns)) is None:
+            return []
+        cached = self._extension_methods.get(ns)
+        if cached is None or cached[0] is not mgr:
+            methods = [getattr(ext.obj, ns) for ext in mgr.extensions if hasattr(ext.obj, ns)]
+            cached = self._extension_methods[ns] = (mgr, methods)
+        return cached[1]
+
     def _load_plugins(self):
         """Loads default plugins for any namespace that doesn't have a plugin"""
         for ns in self.PLUGIN_NAMESPACES:
@@ -89,37 +132,29 @@ class GeneticAlgorithm:
             np.ndarray: the crossed-over population
 
         """
-        logging.debug('{} {}'.format(population, agg))
+        logging.debug('%s %s', population, agg)
 
 
         # combine keyword arguments with **kwargs
-        params = locals().copy()
-        params.pop('self', None)
-        kwargs = params.pop('kwargs')
+        params = {'population': population}
 
         # if there is a driver, then use it and run once
-        if mgr := self.driver_managers.get('crossover'):
-            return mgr.driver.crossover(**params, **kwargs)
+        if driver := self._driver('crossover'):
+            return driver(**params, **kwargs)
 
         # if agg=True, then aggregate crossed over populations
-        if kwargs.get('agg'):
+        if agg:
             pops = []
-            for ext in self.extension_managers['crossover'].extensions:
-                try:
-                    pops.append(ext.obj.mutate(**params, **kwargs))
-                except:
-                    continue
-            return np.aggregate(pops)
+            for crossover in self._extensions('crossover'):
+                pops.append(crossover(**params, **kwargs))
+            return np.concatenate(pops)
 
         # otherwise, run crossover for each plugin
         # after first time, crosses over prior crossed-over population
         population = params['population']
-        for ext in self.extension_managers['crossover'].extensions:
-            try:
-                params['population'] = population
-                population = ext.obj.crossover(**kwargs)
-            except:
-                continue
+        for crossover in self._extensions('crossover'):
+            params['population'] = population
+            population = crossover(**params, **kwargs)
         return population
 
     def fitness(self, 
@@ -138,23 +173,18 @@ class GeneticAlgorithm:
             np.ndarray: population fitness as 1D array of float
 
         """
-        logging.debug('{} {}'.format(population, points))
+        logging.debug('%s %s', population, points)
 
         # combine keyword arguments with **kwargs
-        params = locals().copy()
-        params.pop('self', None)
-        kwargs = params.pop('kwargs')
+        params = {'population': population, 'points': points}
 
         # if there is a driver, then use it and run once
-        if mgr := self.driver_managers.get('fitness'):
-            return mgr.driver.fitness(**params, **kwargs)
+        if driver := self._driver('fitness'):
+            return driver(**params, **kwargs)
 
         # otherwise, return fitness for first valid plugin
-        for ext in self.extension_managers['fitness'].extensions:
-            try:
-                return ext.obj.fitness(**params, **kwargs)
-            except:
-                continue
+        if methods := self._extensions('fitness'):
+            return methods[0](**params, **kwargs)
 
     def mutate(self, 
                *,
@@ -172,23 +202,18 @@ class GeneticAlgorithm:
             np.ndarray: same shape and dtype as population
 
         """
-        logging.debug('{} {} {} {}'.format(population, mutation_rate))
+        logging.debug('%s %s', population, mutation_rate)
 
         # combine keyword arguments with **kwargs
-        params = locals().copy()
-        params.pop('self', None)
-        kwargs = params.pop('kwargs')
+        params = {'population': population, 'mutation_rate': mutation_rate}
 
         # if there is a driver, then use it and run once
-        if mgr := self.driver_managers.get('mutate'):
-            return mgr.driver.mutate(**params, **kwargs)
+        if driver := self._driver('mutate'):
+            return driver(**params, **kwargs)
 
         # otherwise, mutate with first valid plugin
-        for ext in self.extension_managers['mutate'].extensions:
-            try:
-                return ext.obj.mutate(**params, **kwargs)
-            except:
-                continue
+        if methods := self._extensions('mutate'):
+            return methods[0](**params, **kwargs)
 
     def optimize(self, 
                  **kwargs) -> Dict[str, Any]:
@@ -203,20 +228,15 @@ class GeneticAlgorithm:
         """
         # combine keyword arguments with **kwargs
         # need to figure out best way to pass ga to optimize
-        params = locals().copy()
-        params['ga'] = params.pop('self', None)
-        kwargs = params.pop('kwargs')
+        params = {'ga': self}
 
         # if there is a driver, then use it and run once
-        if mgr := self.driver_managers.get('optimize'):
-            return mgr.driver.optimize(**params, **kwargs)
+        if driver := self._driver('optimize'):
+            return driver(**params, **kwargs)
 
         # otherwise, optimize with first valid plugin
-        for ext in self.extension_managers['optimize'].extensions:
-            try:
-                return ext.obj.optimize(**params, **kwargs)
-            except:
-                continue
+        if methods := self._extensions('optimize'):
+            return methods[0](**params, **kwargs)
             
     def pool(self, *, csvpth: Path = None, **kwargs) -> pd.DataFrame:
         """Creates pool of players.
@@ -230,17 +250,12 @@ class GeneticAlgorithm:
         
         """
         # combine keyword arguments with **kwargs
-        params = locals().copy()
-        params.pop('self', None)
-        kwargs = params.pop('kwargs')
-
-        if mgr := self.driver_managers.get('pool'):
-            return mgr.driver.pool(**params, **kwargs)   
-        for ext in self.extension_managers['pool'].extensions:
-            try:
-                return ext.obj.pool(**params, **kwargs)  
-            except:
-                logging.error(f'Could not load {ext}')
+        params = {'csvpth': csvpth}
+
+        if driver := self._driver('pool'):
+            return driver(**params, **kwargs)   
+        if methods := self._extensions('pool'):
+            return methods[0](**params, **kwargs)
 
     def populate(self,
                  *,
@@ -248,7 +263,7 @@ class GeneticAlgorithm:
                  posmap: Dict[str, int] = None,
                  population_size: int = None,
                  probcol: str = 'prob',
-                 agg: bool = 'False',
+                 agg: bool = False,
                  **kwargs) -> np.ndarray:
         """Creates initial population of specified size
         
@@ -264,34 +279,25 @@ class GeneticAlgorithm:
             np.ndarray: the population
 
         """
-        logging.debug('{} {} {} {}'.format(pospool, posmap, population_size, probcol))
+        logging.debug('%s %s %s %s', pospool, posmap, population_size, probcol)
 
         # combine keyword arguments with **kwargs
-        params = locals().copy()
-        params.pop('self', None)
-        agg = params.pop('agg')
-        kwargs = params.pop('kwargs')
+        params = {'pospool': pospool, 'posmap': posmap, 'population_size': population_size, 'probcol': probcol}
 
         # if there is a driver, then use it and run once
-        if mgr := self.driver_managers.get('populate'):
-            return mgr.driver.populate(**params, **kwargs)
+        if driver := self._driver('populate'):
+            return driver(**params, **kwargs)
 
         # if agg=True, then aggregate populations
         if agg:
             pops = []
-            for ext in self.extension_managers['populate'].extensions:
-                try:
-                    pops.append(ext.obj.populate(**params, **kwargs))  
-                except:
-                    continue
+            for populate in self._extensions('populate'):
+                pops.append(populate(**params, **kwargs))
             return np.concatenate(pops)
 
         # otherwise, run populate using first valid plugin
-        for ext in self.extension_managers['crossover'].extensions:
-            try:
-                return ext.obj.populate(**kwargs)
-            except:
-                continue
+        if methods := self._extensions('populate'):
+            return methods[0](**params, **kwargs)
 
     def pospool(self, 
                 *,
@@ -313,22 +319,17 @@ class GeneticAlgorithm:
             Dict[str, pd.DataFrame] where keys == posfilter.keys
 
         """
-        logging.debug('{} {} {} {}'.format(pool, posfilter, column_mapping, flex_positions))
+        logging.debug('%s %s %s %s', pool, posfilter, column_mapping, flex_positions)
 
         # combine keyword arguments with **kwargs
-        params = locals().copy()
-        params.pop('self', None)
-        kwargs = params.pop('kwargs')
+        params = {'pool': pool, 'posfilter': posfilter, 'column_mapping': column_mapping, 'flex_positions': flex_positions}
 
         # if there is a driver, then use it and run once
         # otherwise, run pospool using first valid plugin
-        if mgr := self.driver_managers.get('pospool'): 
-            return mgr.driver.pospool(**params, **kwargs)
-        for ext in self.extension_managers['pospool'].extensions:
-            try:
-                return ext.obj.pospool(**params, **kwargs)  
-            except:
-                continue
+        if driver := self._driver('pospool'):
+            return driver(**params, **kwargs)
+        if methods := self._extensions('pospool'):
+            return methods[0](**params, **kwargs)
         
     def select(self,
                *, 
@@ -350,24 +351,21 @@ class GeneticAlgorithm:
             np.ndarray: population fitness as 1D array of float
 
         """
-        logging.debug('Selection method {}, n is {}'.format(method, n))
-        logging.debug('Pop size {}, fitness {}'.format(len(population), population_fitness.mean()))
+        # the mean is computed eagerly, so only when debug output is on
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug('Selection method %s, n is %s', method, n)
+            logging.debug('Pop size %s, fitness %s', len(population), population_fitness.mean())
 
         # combine keyword arguments with **kwargs
-        params = locals().copy()
-        params.pop('self', None)
-        kwargs = params.pop('kwargs')
+        params = {'population': population, 'population_fitness': population_fitness, 'n': n, 'method': method}
 
         # if there is a driver, then use it and run once
-        if mgr := self.driver_managers.get('select'):
-            return mgr.driver.select(**params, **kwargs)
+        if driver := self._driver('select'):
+            return driver(**params, **kwargs)
 
         # otherwise, return select for first valid plugin
-        for ext in self.extension_managers['select'].extensions:
-            try:
-                return ext.obj.select(**params, **kwargs)
-            except:
-                continue
+        if methods := self._extensions('select'):
+            return methods[0](**params, **kwargs)
 
     def validate(self,
                  *,
@@ -385,17 +383,15 @@ class GeneticAlgorithm:
             np.ndarray: same width and dtype as population. Likely less rows due to exclusions.
             
         """
-        logging.debug(f'Salaries {salaries}')
+        logging.debug('Salaries %s', salaries)
 
         # combine keyword arguments with **kwargs
-        params = locals().copy()
-        params.pop('self', None)
-        kwargs = params.pop('kwargs')
+        params = {'population': population, 'salaries': salaries}
 
-        if mgr := self.driver_managers.get('validate'):
-            return mgr.driver.validate(**params, **kwargs)
+        if driver := self._driver('validate'):
+            return driver(**params, **kwargs)
         population = params['population']
-        for ext in self.extension_managers['validate'].extensions:
+        for validate in self._extensions('validate'):
             params['population'] = population
-            population = ext.obj.validate(**params, **kwargs)
+            population = validate(**params, **kwargs)
         return population
@@ -17,9 +17,10 @@ def diversity(population: np.ndarray) -> np.ndarray:
         np.ndarray: is square, shape len(population) x len(population)
 
     """
-    uniques = np.unique(population)
-    a = (population[..., None] == uniques).sum(1)
-    return np.einsum('ij,kj->ik', a, a)
+    # overlap of every pair of lineups is a single matrix product (BLAS)
+    # float32 is exact here because counts are at most the lineup size
+    ohe = membership(population)
+    return (ohe @ ohe.T).astype(np.int64)
 
 
 def exposure(population: np.ndarray = None) -> Dict[int, int]:
@@ -38,32 +39,57 @@ def exposure(population: np.ndarray = None) -> Dict[int, int]:
         >>> print([round(i, 3) for i in sorted(top_exposure / len(fittest_population), reverse=True)])            
 
     """
-    flat = population.flatten
-    return dict(zip(flat, np.bincount(flat)[flat]))
+    # one sorted pass over the flattened population, sized by unique players only
+    ids, counts = np.unique(population, return_counts=True)
+    return dict(zip(ids.tolist(), counts.tolist()))
+
+
+def membership(population: np.ndarray) -> np.ndarray:
+    """One-hot membership matrix of players in lineups
+
+    Args:
+        population (np.ndarray): the population
+
+    Returns:
+        np.ndarray: float32, shape len(population) x number of unique players.
+                    Value is 1 if player is in lineup, otherwise 0.
+
+    """
+    # scatter ones at (lineup, player) rather than comparing every gene to every player
+    uniques, inverse = np.unique(population, return_inverse=True)
+    ohe = np.zeros((len(population), len(uniques)), dtype=np.float32)
+    ohe[np.arange(len(population))[:, None], inverse.reshape(population.shape)] = 1
+    return ohe
 
 
 def multidimensional_shifting(elements: Iterable, 
                               num_samples: int, 
                               sample_size: int, 
-                              probs: Iterable) -> np.ndarray:
+                              probs: Iterable,
+                              rng: np.random.Generator = None) -> np.ndarray:
     """Based on https://medium.com/ibm-watson/incredibly-fast-random-sampling-in-python-baf154bd836a
     
     Args:
-        elements (iterable): iterable to sample from, typically a dataframe index
+        elements (iterable): iterable to sample from, typically a dataframe index or ndarray
         num_samples (int): the number of rows (e.g. initial population size)
         sample_size (int): the number of columns (e.g. team size)
         probs (iterable): is same size as elements
+        rng (np.random.Generator): the random generator, default creates a new one
 
     Returns:
         ndarray: of shape (num_samples, sample_size)
         
     """
-    replicated_probabilities = np.tile(probs, (num_samples, 1))
-    random_shifts = np.random.random(replicated_probabilities.shape)
-    random_shifts /= random_shifts.sum(axis=1)[:, np.newaxis]
-    shifted_probabilities = random_shifts - replicated_probabilities
+    if rng is None:
+        rng = np.random.default_rng()
+    # subtracting the 1D probs broadcasts across rows in place
+    # so there is no need to tile probs into a num_samples x len(probs) array
+    probs = np.asarray(probs)
+    shifted_probabilities = rng.random((num_samples, len(probs)))
+    shifted_probabilities /= shifted_probabilities.sum(axis=1, keepdims=True)
+    shifted_probabilities -= probs
     samples = np.argpartition(shifted_probabilities, sample_size, axis=1)[:, :sample_size]
-    return elements.to_numpy()[samples]
+    return np.asarray(elements)[samples]
 
 
 def parents(population: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
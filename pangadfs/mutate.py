@@ -10,26 +10,33 @@ from pangadfs.base import MutateBase
 
 class MutateDefault(MutateBase):
 
-    def mutate(self, *, population: np.ndarray, mutation_rate: float = .05) -> np.ndarray:
+    def mutate(self, 
+               *, 
+               population: np.ndarray, 
+               mutation_rate: float = .05, 
+               rng: np.random.Generator = None, 
+               **kwargs) -> np.ndarray:
         """Mutates individuals in population
         
         Args:
             population (np.ndarray): the population to mutate. Shape is n_individuals x n_chromosomes.
             mutation_rate (float): decimal value from 0 to 1, default .05
+            rng (np.random.Generator): the random generator, default creates a new one
+            **kwargs: Arbitrary keyword arguments
 
         Returns:
             np.ndarray: same shape as population
 
         """
-        # mutate is ndarray of same shape of population of dtype bool
-        # if mutation_rate is .05, then 1 out of 20 values should be True
-        # where mutate is true, swap randomly-selected player into population
-        # ensures swap comes from same lineup slot, but does not prevent duplicates from other slots
-        # so lineup positional allocation will stay valid, but duplicates are possible
-        mutate = (
-            np.random.binomial(n=1, p=mutation_rate, size=population.size)
-            .reshape(population.shape)
-            .astype(bool)
-        )
-        swap = population[np.random.choice(len(population), size=len(population), replace=False)]
-        return np.where(mutate, swap, population)
+        # each gene mutates independently with probability mutation_rate
+        # so the number of mutations is binomial and their positions are a uniform sample
+        # drawing those directly avoids a random number (and a swap row) for every gene
+        # where a gene mutates, swap in the player from the same lineup slot of a random individual
+        # this keeps lineup positional allocation valid, but duplicates from other slots are possible
+        if rng is None:
+            rng = np.random.default_rng()
+        n_mutations = rng.binomial(n=population.size, p=mutation_rate)
+        rows, cols = np.divmod(rng.choice(population.size, size=n_mutations, replace=False), population.shape[1])
+        mutated = population.copy()
+        mutated[rows, cols] = population[rng.integers(len(population), size=n_mutations), cols]
+        return mutated
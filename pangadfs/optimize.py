@@ -4,55 +4,134 @@
 # Licensed under the MIT License
 
 import logging
-from typing import Any, Dict
+import os
+from pathlib import Path
+from typing import Any, Dict, Tuple
 
 import numpy as np
+import pandas as pd
 
 from pangadfs.base import OptimizeBase
 from pangadfs.ga import GeneticAlgorithm
 
 
+def _settings_key(value: Any) -> Any:
+    """Hashable stand-in for a setting, used in the inputs cache key
+
+    Args:
+        value (Any): a setting passed through to a plugin (dict, list, scalar, None, ...)
+
+    Returns:
+        Any: dicts and lists as tuples, other values unchanged
+
+    """
+    if isinstance(value, dict):
+        return tuple((k, _settings_key(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(_settings_key(v) for v in value)
+    return value
+
+
 class OptimizeDefault(OptimizeBase):
 
-    def optimize(self, ga: GeneticAlgorithm, **kwargs) -> Dict[str, Any]:
-        """Creates initial pool
+    def __init__(self):
+        super().__init__()
+        self._inputs_key = None
+        self._inputs = None
+
+    def _load_inputs(self, ga: GeneticAlgorithm) -> Tuple[pd.DataFrame, Dict[str, pd.DataFrame], np.ndarray, np.ndarray]:
+        """Creates pool, pospool, points and salaries, reusing them across optimize runs
         
         Args:
             ga (GeneticAlgorithm): the ga instance
-            **kwargs: keyword arguments for plugins
             
         Returns:
-            Dict
-            'population': np.ndarray,
-            'fitness': np.ndarray,
-            'best_lineup': pd.DataFrame,
-            'best_score': float
+            Tuple[pd.DataFrame, Dict[str, pd.DataFrame], np.ndarray, np.ndarray]
+            pool, pospool, points, salaries
 
         """
         # create pool and pospool
         # pospool used to generate initial population
         # is a dict of position_name: DataFrame
-        pop_size = ga.ctx['ga_settings']['population_size']
-        pool = ga.pool(csvpth=ga.ctx['ga_settings']['csvpth'])
+        csvpth = ga.ctx['ga_settings']['csvpth']
         cmap = {'points': ga.ctx['ga_settings']['points_column'],
                 'position': ga.ctx['ga_settings']['position_column'],
                 'salary': ga.ctx['ga_settings']['salary_column']}
         posfilter = ga.ctx['site_settings']['posfilter']
         flex_positions = ga.ctx['site_settings']['flex_positions']
+
+        # inputs depend only on the csv file, these settings and the pool/pospool plugins,
+        # so repeated runs (e.g. parameter sweeps) skip reading and splitting the pool again
+        # rewriting the csv file, changing a setting or swapping a plugin reloads them
+        # only a local file can be checked for changes, so anything else
+        # (a URL, a buffer, None for a custom pool plugin) is loaded every run
+        # posfilter and flex_positions belong to the pospool plugin, so their shape is not assumed
+        # and settings that cannot be hashed skip the cache
+        key = None
+        if isinstance(csvpth, (str, os.PathLike)) and Path(csvpth).is_file():
+            key = (str(csvpth), Path(csvpth).stat().st_mtime_ns, _settings_key(cmap),
+                   _settings_key(posfilter), _settings_key(flex_positions),
+                   ga._driver('pool'), tuple(ga._extensions('pool')),
+                   ga._driver('pospool'), tuple(ga._extensions('pospool')))
+            try:
+                hash(key)
+            except TypeError:
+                key = None
+            if key is not None and key == self._inputs_key:
+                return self._inputs
+
+        pool = ga.pool(csvpth=csvpth)
         pospool = ga.pospool(pool=pool, posfilter=posfilter, column_mapping=cmap, flex_positions=flex_positions)
 
         # create salary and points arrays
         # these match indices of pool
-        cmap = {'points': ga.ctx['ga_settings']['points_column'],
-                'salary': ga.ctx['ga_settings']['salary_column']}
-        points = pool[cmap['points']].values
-        salaries = pool[cmap['salary']].values
+        # points is cast once here to the float32 the fitness plugin scores in
+        # rather than on every fitness call in the generation loop
+        # salaries are whole dollars, so int32 holds any lineup total
+        # a blank (NaN) or fractional salary would be mangled by the cast, so those keep their dtype
+        points = np.ascontiguousarray(pool[cmap['points']].to_numpy(), dtype=np.float32)
+        salaries = np.ascontiguousarray(pool[cmap['salary']].to_numpy())
+        if (np.issubdtype(salaries.dtype, np.number)
+                and np.isfinite(salaries).all()
+                and (salaries == np.round(salaries)).all()
+                and np.abs(salaries).max(initial=0) < np.iinfo(np.int32).max):
+            salaries = salaries.astype(np.int32)
+
+        self._inputs_key = key
+        self._inputs = pool, pospool, points, salaries
+        return self._inputs
+
+    def optimize(self, ga: GeneticAlgorithm, **kwargs) -> Dict[str, Any]:
+        """Creates initial pool
         
+        Args:
+            ga (GeneticAlgorithm): the ga instance
+            **kwargs: keyword arguments for plugins
+            
+        Returns:
+            Dict
+            'population': np.ndarray,
+            'fitness': np.ndarray,
+            'best_lineup': pd.DataFrame,
+            'best_score': float
+
+        """
+        pop_size = ga.ctx['ga_settings']['population_size']
+        pool, pospool, points, salaries = self._load_inputs(ga)
+
+        # one generator per random operation, spawned from a single seed
+        # seed is optional; setting it makes the run reproducible
+        seedseq = np.random.SeedSequence(ga.ctx['ga_settings'].get('seed'))
+        populate_rng, select_rng, crossover_rng, mutate_rng = (
+            np.random.default_rng(s) for s in seedseq.spawn(4)
+        )
+
         # create initial population
         initial_population = ga.populate(
             pospool=pospool, 
             posmap=ga.ctx['site_settings']['posmap'], 
-            population_size=pop_size
+            population_size=pop_size,
+            rng=populate_rng
         )
 
         # apply validators
@@ -66,30 +145,48 @@ class OptimizeDefault(OptimizeBase):
 
         # need fitness to determine best lineup
         # and also for selection when loop starts
+        # n_jobs is optional; >1 splits fitness across threads
+        n_jobs = ga.ctx['ga_settings'].get('n_jobs', 1)
         population_fitness = ga.fitness(
             population=initial_population, 
-            points=points
+            points=points,
+            n_jobs=n_jobs
         )
 
         # set overall_max based on initial population
+        # tracked as a Python float so best_score is not returned as np.float32
         omidx = population_fitness.argmax()
-        best_fitness = population_fitness[omidx]
-        best_lineup = initial_population[omidx]
+        best_fitness = float(population_fitness[omidx])
+        best_lineup = initial_population[omidx].copy()
 
         # create new generations
         n_unimproved = 0
-        population = initial_population.copy()
+        population = initial_population
+
+        # elite + mutated are written into a buffer reused across generations
+        # it is only reallocated when the combined population outgrows it
+        combined = np.empty((0, population.shape[1]), dtype=population.dtype)
+
+        # settings used in every generation are looked up once
+        ga_settings = ga.ctx['ga_settings']
+        stop_criteria = ga_settings['stop_criteria']
+        verbose = ga_settings.get('verbose')
+        elite_divisor = ga_settings.get('elite_divisor', 5)
+        elite_method = ga_settings.get('elite_method', 'fittest')
+        select_method = ga_settings.get('select_method', 'roulette')
+        crossover_method = ga_settings.get('crossover_method', 'uniform')
+        salary_cap = ga.ctx['site_settings']['salary_cap']
 
-        for i in range(1, ga.ctx['ga_settings']['n_generations'] + 1):
+        for i in range(1, ga_settings['n_generations'] + 1):
 
             # end program after n generations if not improving
-            if n_unimproved == ga.ctx['ga_settings']['stop_criteria']:
+            if n_unimproved == stop_criteria:
                 break
 
             # display progress information with verbose parameter
-            if ga.ctx['ga_settings'].get('verbose'):
-                logging.info(f'Starting generation {i}')
-                logging.info(f'Best lineup score {best_fitness}')
+            if verbose:
+                logging.info('Starting generation %s', i)
+                logging.info('Best lineup score %s', best_fitness)
 
             # select the population
             # here, we are holding back the fittest 20% to ensure
@@ -97,37 +194,52 @@ class OptimizeDefault(OptimizeBase):
             elite = ga.select(
                 population=population, 
                 population_fitness=population_fitness, 
-                n=len(population) // ga.ctx['ga_settings'].get('elite_divisor', 5),
-                method=ga.ctx['ga_settings'].get('elite_method', 'fittest')
+                n=len(population) // elite_divisor,
+                method=elite_method,
+                rng=select_rng
             )
 
             selected = ga.select(
                 population=population, 
                 population_fitness=population_fitness, 
                 n=len(population),
-                method=ga.ctx['ga_settings'].get('select_method', 'roulette')
+                method=select_method,
+                rng=select_rng
             )
 
             # cross over the population
             # here, we use uniform crossover, which splits the population
             # and randomly exchanges 0 - all chromosomes
-            crossed_over = ga.crossover(population=selected, method=ga.ctx['ga_settings'].get('crossover_method', 'uniform'))
+            crossed_over = ga.crossover(
+                population=selected, 
+                method=crossover_method,
+                rng=crossover_rng
+            )
 
             # mutate the crossed over population (leave elite alone)
             # can use fixed rate or variable to reduce mutation over generations
             # here we use a variable rate that increases if no improvement is found
-            mutation_rate = ga.ctx['ga_settings'].get('mutation_rate', max(.05, n_unimproved / 50))
-            mutated = ga.mutate(population=crossed_over, mutation_rate=mutation_rate)
+            mutation_rate = ga_settings.get('mutation_rate', max(.05, n_unimproved / 50))
+            mutated = ga.mutate(population=crossed_over, mutation_rate=mutation_rate, rng=mutate_rng)
 
             # validate the population (elite + mutated)
+            n_combined = len(elite) + len(mutated)
+            if len(combined) < n_combined:
+                combined = np.empty((n_combined, population.shape[1]), dtype=population.dtype)
+            np.concatenate((elite, mutated), out=combined[:n_combined])
             population = ga.validate(
-                population=np.vstack((elite, mutated)), 
+                population=combined[:n_combined], 
                 salaries=salaries, 
-                salary_cap=ga.ctx['site_settings']['salary_cap']
+                salary_cap=salary_cap
             )
+
+            # a validator can return its input (e.g. when it drops nothing)
+            # the buffer is overwritten next generation, so the population must not share it
+            if np.shares_memory(population, combined):
+                population = population.copy()
             
             # assess fitness and get the best score
-            population_fitness = ga.fitness(population=population, points=points)
+            population_fitness = ga.fitness(population=population, points=points, n_jobs=n_jobs)
             omidx = population_fitness.argmax()
             generation_max = population_fitness[omidx]
         
@@ -135,16 +247,18 @@ class OptimizeDefault(OptimizeBase):
             # and save the new best score and lineup
             # otherwise increment n_unimproved
             if generation_max > best_fitness:
-                logging.info(f'Lineup improved to {generation_max}')
-                best_fitness = generation_max
-                best_lineup = population[omidx]
+                logging.info('Lineup improved to %s', generation_max)
+                best_fitness = float(generation_max)
+                best_lineup = population[omidx].copy()
                 n_unimproved = 0
             else:
                 n_unimproved += 1
-                logging.info(f'Lineup unimproved {n_unimproved} times')
+                logging.info('Lineup unimproved %s times', n_unimproved)
 
         # FINALIZE RESULTS
         # will break after n_generations or when stop_criteria reached
+        # lineups hold pool index labels (pospool keeps pool.index and populate samples it),
+        # so look them up by label with loc
         return {
             'population': population,
             'fitness': population_fitness,
@@ -24,8 +24,27 @@ Idea is to replace optimizer rules with penalties. Penalties can be negative (ba
 
 """
 
+import math
+
 import numpy as np
 from pangadfs.base import PenaltyBase
+from pangadfs.misc import membership
+
+
+def _standardize(x: np.ndarray) -> np.ndarray:
+    """Negative z-score of penalty values, 0 when they are all equal
+
+    Args:
+        x (np.ndarray): raw penalty values, any shape (e.g. the 2D distance matrix)
+
+    Returns:
+        np.ndarray: float array, same shape as x
+
+    """
+    std = x.std()
+    if std == 0:
+        return np.zeros_like(x, dtype=np.float64)
+    return (x.mean() - x) / std
 
 
 class DistancePenalty(PenaltyBase):
@@ -44,16 +63,18 @@ class DistancePenalty(PenaltyBase):
               conversely, can deprioritize distance at RB or other position
         """
         # one-hot encoded population
-        # so, assume pool has ids 0, 1, 2, 3, 4
+        # so, assume population has ids 0, 1, 2, 3, 4
         # lineup is 1, 2
         # ohe would be [0, 1, 1, 0, 0] for that lineup
-        ohe = np.sum((np.arange(population.max()) == population[...,None]-1).astype(int), axis=1)
+        ohe = membership(population)
 
         # now calculate distance between individuals in population
         # dist is a square matrix same length as population
-        b = ohe.reshape(ohe.shape[0], 1, ohe.shape[1])
-        dist = np.sqrt(np.einsum('ijk, ijk->ij', ohe-b, ohe-b))
-        return 0 - ((dist - dist.mean()) / dist.std())
+        # |a - b|^2 = |a|^2 + |b|^2 - 2ab, and |a|^2 is the diagonal of the gram matrix
+        gram = ohe @ ohe.T
+        sq = np.diag(gram)
+        dist = np.sqrt(np.maximum(sq[:, None] + sq[None, :] - 2 * gram, 0))
+        return _standardize(dist)
 
 
 class DiversityPenalty(PenaltyBase):
@@ -68,11 +89,11 @@ class DiversityPenalty(PenaltyBase):
             np.ndarray: 1D array of float
 
         """
-        uniques = np.unique(population)
-        a = (population[..., None] == uniques).sum(1)
-        out = np.einsum('ij,kj->ik', a, a)
-        diversity = np.sum(out, axis=1) / population.size
-        return 0 - ((diversity - diversity.mean()) / diversity.std())
+        # row sums of the pairwise overlap matrix, ohe @ ohe.T,
+        # equal ohe @ (player counts), so the square matrix is never built
+        ohe = membership(population)
+        diversity = ohe @ ohe.sum(axis=0) / population.size
+        return _standardize(diversity)
 
 
 class OwnershipPenalty(PenaltyBase):
@@ -89,7 +110,12 @@ class OwnershipPenalty(PenaltyBase):
             np.ndarray: 1D array of penalties
             
         """
-        return 0 - np.log(ownership) / np.log(base) + boost
+        # scale by a precomputed scalar reciprocal and finish in place
+        # so only the array from np.log is allocated
+        penalty = np.log(ownership)
+        penalty *= -1 / math.log(base)
+        penalty += boost
+        return penalty
 
 
 class HighOwnershipPenalty(PenaltyBase):
@@ -19,6 +19,8 @@ class PopulateDefault(PopulateBase):
                  posmap: Dict[str, int], 
                  population_size: int, 
                  probcol: str='prob',
+                 max_flex_redraws: int = 100,
+                 rng: np.random.Generator = None,
                  **kwargs) -> np.ndarray:
         """Creates individuals in population
         
@@ -27,14 +29,24 @@ class PopulateDefault(PopulateBase):
             posmap (Dict[str, int]): positions & accompanying roster slots
             population_size (int): number of individuals to create
             probcol (str): the dataframe column with probabilities
+            max_flex_redraws (int): times to redraw FLEX candidates that all duplicate the lineup
+            rng (np.random.Generator): the random generator, default creates a new one
             **kwargs: keyword arguments
 
         Returns:
-            ndarray of size (population_size, sum(posmap.values()))
+            ndarray of size (population_size, sum(posmap.values())), dtype int32
 
         """
+        if rng is None:
+            rng = np.random.default_rng()
+        # pull index and probabilities out of pandas once
+        # so sampling only touches ndarrays
+        # player ids are pool indices, so int32 is ample and halves memory vs int64
+        assert max(pospool[pos].index.max() for pos in posmap) < np.iinfo(np.int32).max
+        ids = {pos: pospool[pos].index.to_numpy(dtype=np.int32) for pos in posmap}
+        probs = {pos: pospool[pos][probcol].to_numpy() for pos in posmap}
         pos_samples = {
-            pos: multidimensional_shifting(pospool[pos].index, population_size, n, pospool[pos][probcol])
+            pos: multidimensional_shifting(ids[pos], population_size, n, probs[pos], rng=rng)
             for pos, n in posmap.items()
         }
 
@@ -44,6 +56,22 @@ class PopulateDefault(PopulateBase):
         # find non-duplicate FLEX and aggregate with other positions
         # https://stackoverflow.com/questions/65473095
         # https://stackoverflow.com/questions/54155844/
-        dups = (pos_samples['FLEX'][..., None] == pop[:, None, :]).any(-1)
-        return np.column_stack((pop, pos_samples['FLEX'][np.invert(dups).cumsum(axis=1).cumsum(axis=1) == 1]))
- 
\ No newline at end of file
+        flex = pos_samples['FLEX']
+        dups = (flex[..., None] == pop[:, None, :]).any(-1)
+
+        # if every FLEX candidate is already in the lineup, redraw candidates for those rows only
+        # cannot happen when there are more FLEX candidates than FLEX-eligible roster slots
+        # a FLEX pool that can never fill the slot (e.g. only players already rostered) would redraw forever, so cap it
+        bad = dups.all(axis=1)
+        for _ in range(max_flex_redraws):
+            if not bad.any():
+                break
+            flex[bad] = multidimensional_shifting(ids['FLEX'], bad.sum(), posmap['FLEX'], probs['FLEX'], rng=rng)
+            dups[bad] = (flex[bad][..., None] == pop[bad][:, None, :]).any(-1)
+            bad = dups.all(axis=1)
+        if bad.any():
+            raise ValueError(f'could not fill FLEX for {bad.sum()} lineups after {max_flex_redraws} redraws; '
+                             'check that the FLEX pool has players outside the other positions')
+
+        # argmax of the inverted mask is the first non-duplicate candidate in each row
+        return np.column_stack((pop, flex[np.arange(len(flex)), np.argmax(~dups, axis=1)]))
@@ -4,6 +4,8 @@
 # Licensed under the MIT License
 
 from typing import Dict, Iterable
+
+import numpy as np
 import pandas as pd
 
 from pangadfs.base import PospoolBase
@@ -36,12 +38,21 @@ class PospoolDefault(PospoolBase):
         poscol = column_mapping.get('position', 'pos')
         pointscol = column_mapping.get('points', 'proj')
         salcol = column_mapping.get('salary', 'salary')
+
+        # pull columns out of pandas once and do the filtering on ndarrays
+        # points per $1000 of salary is the same for every position, so compute it once
+        positions = pool[poscol].to_numpy()
+        points = pool[pointscol].to_numpy()
+        salaries = pool[salcol].to_numpy()
+        points_per_dollar = (points / salaries) * 1000
         for position, thresh in posfilter.items():
             if position == 'FLEX':
-                tmp = pool.loc[(pool[poscol].isin(flex_positions)) & (pool[pointscol] >= thresh), [pointscol, salcol]]      
+                mask = np.isin(positions, flex_positions) & (points >= thresh)
             else:           
-                tmp = pool.loc[(pool[poscol] == position) & (pool[pointscol] >= thresh), [pointscol, salcol]]
-            prob_ = (tmp[pointscol] / tmp[salcol]) * 1000
-            prob_ = prob_ / prob_.sum()
-            d[position] = tmp.assign(prob=prob_)
+                mask = (positions == position) & (points >= thresh)
+            prob_ = points_per_dollar[mask]
+            d[position] = pd.DataFrame(
+                {pointscol: points[mask], salcol: salaries[mask], 'prob': prob_ / prob_.sum()},
+                index=pool.index[mask]
+            )
         return d
@@ -29,13 +29,15 @@ class SelectDefault(SelectBase):
         """
         # argpartition produces an unsorted rearrangement
         # use negative parameter and slice to get top n values
-        return population[np.argpartition(population_fitness, -n, axis=0)][-n:]
+        # slice the indices before gathering so only n rows are copied
+        return population[np.argpartition(population_fitness, -n, axis=0)[-n:]]
 
     def _rank(self, 
                *, 
                population: np.ndarray, 
                population_fitness: np.ndarray,
                n: int,
+               rng: np.random.Generator = None,
                **kwargs) -> np.ndarray:
         """Rank selection of individuals in population. 
         
@@ -43,24 +45,28 @@ class SelectDefault(SelectBase):
             population (np.ndarray): the population to mutate. Shape is n_individuals x n_chromosomes.
             population_fitness (np.ndarray): the population fitness. Is a 1D array same length as population.
             n (int): total number of individuals to select
+            rng (np.random.Generator): the random generator, default creates a new one
             **kwargs: keyword arguments for plugins
 
         Returns:
             np.ndarray: selected population
 
         """
+        if rng is None:
+            rng = np.random.default_rng()
         elements = len(population)
         temp = population_fitness.argsort()
         ranks = np.empty_like(temp)
         ranks[temp] = np.arange(1, elements + 1)
         weights = ranks / ranks.sum()
-        return population[np.random.choice(elements, size=n, replace=False, p=weights)]
+        return population[rng.choice(elements, size=n, replace=False, p=weights)]
 
     def _roulette_wheel(self, 
                         *, 
                         population: np.ndarray, 
                         population_fitness: np.ndarray,
                         n: int,
+                        rng: np.random.Generator = None,
                         **kwargs) -> np.ndarray:
         """Select individuals in population using stochastic universal sampling, which samples without replacement.
         
@@ -68,27 +74,37 @@ class SelectDefault(SelectBase):
             population (np.ndarray): the population to mutate. Shape is n_individuals x n_chromosomes.
             population_fitness (np.ndarray): the population fitness. Is a 1D array same length as population.
             n (int): total number of individuals to select
+            rng (np.random.Generator): the random generator, default creates a new one
             **kwargs: keyword arguments for plugins
 
         Returns:
             np.ndarray: selected population
 
         """
-        # alternative implementation if np.random.choice changes
-        # fitness_cumsum = fitness.cumsum()   # the "roulette wheel"
-        # fitness_sum = fitness_cumsum[-1]    # sum of all fitness values (size of the wheel)
-        # sampled_values = np.random.random(size) * fitness_sum
-        # For each sampled value, get the corresponding roulette wheel slot
-        # selected = np.searchsorted(fitness_cumsum, sampled_values)
-        # return selected
-        weights = population_fitness / population_fitness.sum()
-        return population[np.random.choice(len(population_fitness), size=n, replace=True, p=weights)]       
+        if rng is None:
+            rng = np.random.default_rng()
+        # this is what rng.choice(p=weights) does, minus normalizing the weights
+        # negative or NaN fitness would silently skew the wheel, so reject it like rng.choice does
+        # (not >= 0 is also true for NaN)
+        if not (population_fitness >= 0).all():
+            raise ValueError('roulette wheel selection requires non-negative fitness')
+
+        # accumulate in float64 so the wheel is not skewed by float32 rounding
+        fitness_cumsum = np.cumsum(population_fitness, dtype=np.float64)   # the "roulette wheel"
+        fitness_sum = fitness_cumsum[-1]    # sum of all fitness values (size of the wheel)
+        if not fitness_sum > 0:
+            raise ValueError('roulette wheel selection requires fitness that sums to more than zero')
+        sampled_values = rng.random(n) * fitness_sum
+
+        # for each sampled value, get the corresponding roulette wheel slot
+        return population[np.searchsorted(fitness_cumsum, sampled_values, side='right')]
 
     def _scaled(self, 
                *, 
                population: np.ndarray, 
                population_fitness: np.ndarray,
                n: int,
+               rng: np.random.Generator = None,
                **kwargs) -> np.ndarray:
         """Select individuals in population using scaled fitness.
         
@@ -96,21 +112,25 @@ class SelectDefault(SelectBase):
             population (np.ndarray): the population to mutate. Shape is n_individuals x n_chromosomes.
             population_fitness (np.ndarray): the population fitness. Is a 1D array same length as population.
             n (int): total number of individuals to select
+            rng (np.random.Generator): the random generator, default creates a new one
             **kwargs: keyword arguments for plugins
 
         Returns:
             np.ndarray: selected population
 
         """
+        if rng is None:
+            rng = np.random.default_rng()
         scaled = (population_fitness - population_fitness.min()) / (population_fitness.max() - population_fitness.min())
         weights = scaled / scaled.sum()
-        return population[np.random.choice(len(population), size=n, replace=False, p=weights)]
+        return population[rng.choice(len(population), size=n, replace=False, p=weights)]
 
     def _sus(self, 
              *, 
              population: np.ndarray, 
              population_fitness: np.ndarray,
              n: int,
+             rng: np.random.Generator = None,
              **kwargs) -> np.ndarray:
         """Select individuals in population using stochastic universal sampling, which samples without replacement.
         
@@ -118,12 +138,15 @@ class SelectDefault(SelectBase):
             population (np.ndarray): the population to mutate. Shape is n_individuals x n_chromosomes.
             population_fitness (np.ndarray): the population fitness. Is a 1D array same length as population.
             n (int): total number of individuals to select
+            rng (np.random.Generator): the random generator, default creates a new one
             **kwargs: keyword arguments for plugins
 
         Returns:
             np.ndarray: selected population
 
         """
+        if rng is None:
+            rng = np.random.default_rng()
         # cumsum creates the roulette wheel
         # is order-insensitive: if 1st element largest, starts there
         fitness_cumsum = population_fitness.cumsum()
@@ -132,7 +155,7 @@ class SelectDefault(SelectBase):
         # so if total is 100 and n is 10
         # 1st point is 10 starting point is first element > 10
         step = fitness_sum / n
-        start = np.random.random() * step
+        start = rng.random() * step
 
         # selectors are the evenly-spaced points on wheel
         selectors = np.arange(start, fitness_sum, step)
@@ -146,24 +169,44 @@ class SelectDefault(SelectBase):
                     *, 
                     population: np.ndarray, 
                     population_fitness: np.ndarray,
+                    n: int,
                     tournament_size: int = 2,
+                    rng: np.random.Generator = None,
                     **kwargs) -> np.ndarray:
         """Tournament selection of individuals in population. 
         
         Args:
             population (np.ndarray): the population to mutate. Shape is n_individuals x n_chromosomes.
             population_fitness (np.ndarray): the population fitness. Is a 1D array same length as population.
+            n (int): total number of individuals to select
             tournament_size (int): number of individuals to compete against each other
+            rng (np.random.Generator): the random generator, default creates a new one
             **kwargs: keyword arguments for plugins
 
         Returns:
             np.ndarray: selected population
 
         """
-        max_idx = len(population_fitness) // tournament_size * tournament_size
-        tournament_fitness = population_fitness[:max_idx].reshape(-1, tournament_size)
-        winners = np.argmax(tournament_fitness, axis=1) + np.arange(max_idx, step=tournament_size)
-        return population[winners]
+        if rng is None:
+            rng = np.random.default_rng()
+
+        # draw competitors for all n tournaments at once
+        # competitors is shape n x tournament_size
+        competitors = rng.integers(len(population_fitness), size=(n, tournament_size))
+        tournament_fitness = population_fitness[competitors]
+
+        # running max across the (small) tournament axis
+        # is faster than a row-wise argmax over many tiny rows
+        # strict comparison keeps the first of tied competitors, same as argmax
+        winners = np.zeros(n, dtype=np.intp)
+        best_fitness = tournament_fitness[:, 0].copy()
+        better = np.empty(n, dtype=bool)
+        for i in range(1, tournament_size):
+            competitor_fitness = tournament_fitness[:, i]
+            np.greater(competitor_fitness, best_fitness, out=better)
+            winners[better] = i
+            np.maximum(best_fitness, competitor_fitness, out=best_fitness)
+        return population[competitors[np.arange(n), winners]]
 
     def select(self, 
                *, 
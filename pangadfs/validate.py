@@ -4,7 +4,6 @@
 # Licensed under the MIT License
 
 import numpy as np
-from numpy_indexed import unique
 
 from pangadfs.base import ValidateBase
 
@@ -27,9 +26,24 @@ class DuplicatesValidate(ValidateBase):
         """
         # the first part eliminates individuals with duplicate genes
         # the second part eliminates duplicate individuals
+        # both parts work on the same sorted rows, so sort only once
         population_sorted = np.sort(population, axis=-1)
-        population = population[(population_sorted[...,1:] != population_sorted[..., :-1]).all(-1)]
-        return unique(np.sort(population, axis=1))
+        population_sorted = population_sorted[(population_sorted[..., 1:] != population_sorted[..., :-1]).all(-1)]
+
+        # hash each sorted row to one uint64 (FNV-1a over the genes), so finding
+        # duplicates is a 1D sort rather than a lexicographic sort of rows
+        row_hash = np.full(len(population_sorted), 14695981039346656037, dtype=np.uint64)
+        for genes in population_sorted.T:
+            row_hash ^= genes.astype(np.uint64)
+            row_hash *= np.uint64(1099511628211)
+        order = np.argsort(row_hash)
+        row_hash, population_sorted = row_hash[order], population_sorted[order]
+
+        # a row is dropped only if it equals its neighbor, not just its hash
+        # so a hash collision can at worst keep a duplicate, never drop a lineup
+        keep = np.ones(len(population_sorted), dtype=bool)
+        keep[1:] = (row_hash[1:] != row_hash[:-1]) | (population_sorted[1:] != population_sorted[:-1]).any(-1)
+        return population_sorted[keep]
 
 
 class SalaryValidate(ValidateBase):
@@ -52,5 +66,7 @@ class SalaryValidate(ValidateBase):
                 np.ndarray: same width as population, likely has less rows
 
         """
-        popsal = np.sum(salaries[population], axis=1)
+        # accumulate in the salaries dtype (int32 from optimize) rather than
+        # numpy's default int64 for integer sums; a lineup total cannot overflow it
+        popsal = np.sum(np.take(salaries, population), axis=1, dtype=salaries.dtype)
         return population[popsal <= salary_cap]
@@ -13,7 +13,7 @@ from pangadfs.fitness import FitnessDefault
 def test_crossover_default(pop):
     newpop = CrossoverDefault().crossover(population=pop, method='uniform')
     assert isinstance(newpop, np.ndarray)
-    assert newpop.dtype == 'int64'
+    assert newpop.dtype == 'int32'
 
 
 def test_crossover_diverse(pop):
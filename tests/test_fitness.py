@@ -15,5 +15,42 @@ def test_fitness_default(p, pop):
       population=pop, points=points
     )
     assert isinstance(fitness, np.ndarray)
-    assert fitness.dtype == 'float64'
+    assert fitness.dtype == 'float32'
 
+
+def test_fitness_default_n_jobs(p, pop):
+    points = p['proj'].values
+    fitness = FitnessDefault().fitness(
+      population=pop, points=points
+    )
+    fitness_threaded = FitnessDefault().fitness(
+      population=pop, points=points, n_jobs=3
+    )
+    assert np.array_equal(fitness, fitness_threaded)
+
+
+def test_fitness_default_buffer(p, pop):
+    points = p['proj'].values
+    fitness = FitnessDefault()
+    expected = np.sum(points[pop], axis=1)
+    assert np.allclose(fitness.fitness(population=pop[:10], points=points), expected[:10])
+    assert np.allclose(fitness.fitness(population=pop, points=points), expected)
+    assert np.allclose(fitness.fitness(population=pop[:10], points=points), expected[:10])
+
+
+def test_fitness_default_noncontiguous(p, pop):
+    points = p['proj'].values
+    fitness = FitnessDefault()
+    view = pop[::2, ::-1]
+    assert not view.flags['C_CONTIGUOUS']
+    assert np.allclose(fitness.fitness(population=view, points=points), np.sum(points[view], axis=1))
+
+
+def test_fitness_default_out_of_bounds():
+    points = np.array([1., 2., 3.])
+    fitness = FitnessDefault()
+    for population in ([[0, 1, 5], [2, 0, 1]], [[0, 1, 2], [-1, 0, 1]]):
+        with pytest.raises(IndexError):
+            fitness.fitness(population=np.array(population, dtype=np.int32), points=points)
+        with pytest.raises(IndexError):
+            fitness.fitness(population=np.array(population, dtype=np.int32), points=points, n_jobs=2)
@@ -10,7 +10,9 @@ import numpy as np
 import pandas as pd
 import pytest
 from stevedore import driver, named
+from stevedore import extension as extension_module
 
+from pangadfs.fitness import FitnessDefault
 from pangadfs.ga import GeneticAlgorithm
 
 
@@ -102,6 +104,124 @@ def test_init(ctx, dms, ems):
     assert obj is not None
 
 
+def test_driver(ga, dms):
+    assert ga._driver('fitness') == dms['fitness'].driver.fitness
+    assert ga._driver('fitness') is ga._driver('fitness')
+    assert ga._driver('validate') is None
+    mgr = driver.DriverManager(namespace='pangadfs.fitness', name='fitness_default', invoke_on_load=True)
+    ga.driver_managers['fitness'] = mgr
+    assert ga._driver('fitness') == mgr.driver.fitness
+
+
+def test_extensions(ga, ems):
+    assert ga._extensions('validate') == [ext.obj.validate for ext in ems['validate'].extensions]
+    assert ga._extensions('validate') is ga._extensions('validate')
+    assert ga._extensions('fitness') == []
+
+
+def test_optimize_inputs(ctx, ga):
+    ctx['site_settings']['flex_positions'] = ('RB', 'WR', 'TE')
+    optimizer = ga.driver_managers['optimize'].driver
+    inputs = optimizer._load_inputs(ga)
+    assert optimizer._load_inputs(ga) is inputs
+    ctx['site_settings']['posfilter'] = {**ctx['site_settings']['posfilter'], 'QB': 20}
+    assert optimizer._load_inputs(ga) is not inputs
+    inputs = optimizer._load_inputs(ga)
+    ga.driver_managers['pool'] = driver.DriverManager(namespace='pangadfs.pool', name='pool_default', invoke_on_load=True)
+    assert optimizer._load_inputs(ga) is not inputs
+
+
+def test_optimize_inputs_salaries(ctx, ga, tmp_path):
+    ctx['site_settings']['flex_positions'] = ('RB', 'WR', 'TE')
+    optimizer = ga.driver_managers['optimize'].driver
+    assert optimizer._load_inputs(ga)[3].dtype == 'int32'
+
+    # a blank salary must not be cast to a huge negative int that passes the salary cap
+    pool = pd.read_csv(ctx['ga_settings']['csvpth'])
+    pool.loc[0, 'salary'] = np.nan
+    ctx['ga_settings']['csvpth'] = tmp_path / 'pool.csv'
+    pool.to_csv(ctx['ga_settings']['csvpth'], index=False)
+    salaries = optimizer._load_inputs(ga)[3]
+    assert np.isnan(salaries[0])
+    population = np.array([[0, 1], [1, 2]], dtype=np.int32)
+    assert np.array_equal(ga.validate(population=population, salaries=salaries, salary_cap=50000), population[[1]])
+
+
+def test_optimize_inputs_not_a_file(ctx, ga):
+    csvpth_file = ctx['ga_settings']['csvpth']
+    default_pool = ga.driver_managers['pool'].driver
+
+    class BufferPool:
+        def pool(self, *, csvpth, **kwargs):
+            return default_pool.pool(csvpth=csvpth_file, **kwargs)
+
+    ctx['site_settings']['flex_positions'] = ('RB', 'WR', 'TE')
+    ctx['ga_settings']['csvpth'] = None
+    extension = extension_module.Extension('pool', None, BufferPool, BufferPool())
+    ga.driver_managers['pool'] = driver.DriverManager.make_test_instance(extension, namespace='pangadfs.pool')
+    optimizer = ga.driver_managers['optimize'].driver
+    inputs = optimizer._load_inputs(ga)
+    assert optimizer._load_inputs(ga) is not inputs
+
+
+def test_optimize_inputs_scalar_posfilter(ctx, ga):
+    # e.g. the showdown pospool takes a single float posfilter and no flex_positions
+    default_pospool = ga.driver_managers['pospool'].driver
+    posfilter = ctx['site_settings']['posfilter']
+
+    class ScalarPospool:
+        def pospool(self, *, pool, column_mapping, **kwargs):
+            return default_pospool.pospool(pool=pool, posfilter=posfilter, column_mapping=column_mapping,
+                                           flex_positions=('RB', 'WR', 'TE'))
+
+    extension = extension_module.Extension('pospool', None, ScalarPospool, ScalarPospool())
+    ga.driver_managers['pospool'] = driver.DriverManager.make_test_instance(extension, namespace='pangadfs.pospool')
+    ctx['site_settings']['posfilter'] = 2.0
+    ctx['site_settings']['flex_positions'] = None
+    optimizer = ga.driver_managers['optimize'].driver
+    inputs = optimizer._load_inputs(ga)
+    assert optimizer._load_inputs(ga) is inputs
+    ctx['site_settings']['posfilter'] = 3.0
+    assert optimizer._load_inputs(ga) is not inputs
+
+
+def test_optimize_validate_returns_input(ctx, dms, ems):
+    class PassthroughValidate:
+        """Runs the default validators on every other call, otherwise returns its input"""
+        calls = 0
+
+        def validate(self, *, population, salaries, salary_cap, **kwargs):
+            self.calls += 1
+            if self.calls % 2:
+                return population
+            for ext in ems['validate'].extensions:
+                population = ext.obj.validate(population=population, salaries=salaries, salary_cap=salary_cap)
+            return population
+
+    class RecordingFitness(FitnessDefault):
+        """Scores 1.5x points and keeps the best fitness optimize has seen, which best_score must match"""
+        best = float('-inf')
+
+        def fitness(self, **kwargs):
+            population_fitness = super().fitness(**kwargs) * 1.5
+            self.best = max(self.best, float(population_fitness.max()))
+            return population_fitness
+
+    ctx['ga_settings']['population_size'] = 500
+    ctx['site_settings']['flex_positions'] = ('RB', 'WR', 'TE')
+    ctx['site_settings']['posmap'] = {**ctx['site_settings']['posmap'], 'FLEX': 1}
+    for seed in range(10):
+        ctx['ga_settings']['seed'] = seed
+        extension = extension_module.Extension('validate', None, PassthroughValidate, PassthroughValidate())
+        dms['validate'] = driver.DriverManager.make_test_instance(extension, namespace='pangadfs.validate')
+        fitness = RecordingFitness()
+        extension = extension_module.Extension('fitness', None, RecordingFitness, fitness)
+        dms['fitness'] = driver.DriverManager.make_test_instance(extension, namespace='pangadfs.fitness')
+        results = GeneticAlgorithm(ctx=ctx, driver_managers=dms).optimize()
+        assert type(results['best_score']) is float
+        assert results['best_score'] == pytest.approx(fitness.best, abs=1e-3)
+
+
 def test_pool(test_directory, ga):
     csvpth = test_directory / 'test_pool.csv'
     pool = ga.pool(csvpth=csvpth)    
@@ -109,6 +229,15 @@ def test_pool(test_directory, ga):
     assert not pool.empty
 
 
+def test_pool_extensions(test_directory, ctx):
+    mgr = named.NamedExtensionManager(namespace='pangadfs.pool', names=['pool_default'], invoke_on_load=True)
+    ga = GeneticAlgorithm(ctx=ctx, extension_managers={'pool': mgr})
+    pool = ga.pool(csvpth=test_directory / 'test_pool.csv')
+    assert isinstance(pool, pd.core.api.DataFrame)
+    with pytest.raises(FileNotFoundError):
+        ga.pool(csvpth=test_directory / 'missing.csv')
+
+
 def test_pospool(p, pf, ga):
     pospool = ga.pospool(
       pool=p, posfilter=pf, column_mapping={}, flex_positions=('RB', 'WR', 'TE')
@@ -127,13 +256,22 @@ def test_populate(pp, pm, ga):
     assert len(population) == size
 
 
+def test_populate_extensions(ctx, pp, pm):
+    mgr = named.NamedExtensionManager(namespace='pangadfs.populate', names=['populate_default'], invoke_on_load=True)
+    ga = GeneticAlgorithm(ctx=ctx, extension_managers={'populate': mgr})
+    population = ga.populate(pospool=pp, posmap=pm, population_size=100)
+    assert population.shape == (100, 9)
+    population = ga.populate(pospool=pp, posmap=pm, population_size=100, agg=True)
+    assert population.shape == (100, 9)
+
+
 def test_fitness(p, pop, ga):
     points = p['proj'].values
     fitness = ga.fitness(
       population=pop, points=points
     )
     assert isinstance(fitness, np.ndarray)
-    assert fitness.dtype == 'float64'
+    assert fitness.dtype == 'float32'
 
 
 def test_select(p, pop, ga):
@@ -149,14 +287,30 @@ def test_select(p, pop, ga):
     )
 
     assert isinstance(selected, np.ndarray)
-    assert selected.dtype == 'int64'
+    assert selected.dtype == 'int32'
 
 
 def test_crossover(p, pop, ga):
     points = p['proj'].values
     newpop = ga.crossover(population=pop, method='uniform')
     assert isinstance(newpop, np.ndarray)
-    assert newpop.dtype == 'int64'
+    assert newpop.dtype == 'int32'
+
+
+def test_crossover_agg(ctx, pop):
+    mgr = named.NamedExtensionManager(namespace='pangadfs.crossover', names=['crossover_default'], invoke_on_load=True)
+    ga = GeneticAlgorithm(ctx=ctx, extension_managers={'crossover': mgr})
+    newpop = ga.crossover(population=pop, method='uniform', agg=True)
+    assert isinstance(newpop, np.ndarray)
+    assert newpop.shape == pop.shape
+
+
+def test_crossover_sequential(ctx, pop):
+    mgr = named.NamedExtensionManager(namespace='pangadfs.crossover', names=['crossover_default'], invoke_on_load=True)
+    ga = GeneticAlgorithm(ctx=ctx, extension_managers={'crossover': mgr})
+    newpop = ga.crossover(population=pop, method='one_point')
+    assert newpop.shape == pop.shape
+    assert not np.array_equal(newpop, pop)
 
 
 def test_mutate(pop, ga):
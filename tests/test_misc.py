@@ -0,0 +1,15 @@
+# pangadfs/tests/test_misc.py
+# -*- coding: utf-8 -*-
+# Copyright (C) 2020 Eric Truett
+# Licensed under the MIT License
+
+import numpy as np
+import pytest
+
+from pangadfs.misc import exposure
+
+
+def test_exposure():
+    population = np.array([[0, 1], [1, 2]], dtype=np.int32)
+    assert exposure(population) == {0: 1, 1: 2, 2: 1}
+    assert all(type(k) is int and type(v) is int for k, v in exposure(population).items())
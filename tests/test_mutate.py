@@ -13,3 +13,9 @@ def test_mutate_default(pop):
     mpop = MutateDefault().mutate(population=pop)
     assert pop.shape == mpop.shape
     assert not np.array_equal(pop, mpop)
+
+
+def test_mutate_rng(pop):
+    mpop1 = MutateDefault().mutate(population=pop, rng=np.random.default_rng(1))
+    mpop2 = MutateDefault().mutate(population=pop, rng=np.random.default_rng(1))
+    assert np.array_equal(mpop1, mpop2)
@@ -0,0 +1,34 @@
+# pangadfs/tests/test_penalty.py
+# -*- coding: utf-8 -*-
+# Copyright (C) 2020 Eric Truett
+# Licensed under the MIT License
+
+import numpy as np
+import pytest
+
+from pangadfs.misc import membership
+from pangadfs.penalty import _standardize, DistancePenalty
+
+
+def test_distance_penalty_player_zero():
+    # lineups differ only in player 0, so they must not look identical
+    population = np.array([[0, 1, 2], [3, 1, 2]], dtype=np.int32)
+    ohe = membership(population)
+    assert ohe.shape == (2, 4)
+    assert np.array_equal(ohe.sum(axis=1), [3, 3])
+    penalty = DistancePenalty().penalty(population=population)
+    assert penalty[0, 1] != penalty[0, 0]
+
+
+def test_distance_penalty_gram(pop):
+    ohe = membership(pop).astype(np.float64)
+    dist = np.linalg.norm(ohe[:, None, :] - ohe[None, :, :], axis=-1)
+    penalty = DistancePenalty().penalty(population=pop)
+    assert penalty.shape == (len(pop), len(pop))
+    assert np.allclose(penalty, (dist.mean() - dist) / dist.std(), atol=1e-4)
+
+
+def test_standardize_zero_spread():
+    standardized = _standardize(np.full(4, 7.0))
+    assert np.array_equal(standardized, np.zeros(4))
+    assert not np.isnan(standardized).any()
@@ -4,6 +4,7 @@
 # Licensed under the MIT License
 
 import numpy as np
+import pandas as pd
 import pytest
 
 from pangadfs.populate import *
@@ -15,4 +16,27 @@ def test_populate_default(pp, pm):
       pospool=pp, posmap=pm, population_size=size
     )
     assert isinstance(population, np.ndarray)
-    assert len(population) == size
\ No newline at end of file
+    assert len(population) == size
+
+
+def test_populate_default_flex(pp, pm):
+    # single FLEX candidate often duplicates a player already in the lineup
+    size = 1000
+    population = PopulateDefault().populate(
+      pospool=pp, posmap={**pm, 'FLEX': 1}, population_size=size
+    )
+    assert len(population) == size
+    population_sorted = np.sort(population, axis=1)
+    assert (population_sorted[:, 1:] != population_sorted[:, :-1]).all()
+
+
+def test_populate_default_flex_unfillable():
+    # the only FLEX candidate is the RB already in every lineup
+    pospool = {
+      'RB': pd.DataFrame({'prob': [1.0]}, index=[0]),
+      'FLEX': pd.DataFrame({'prob': [1.0]}, index=[0]),
+    }
+    with pytest.raises(ValueError):
+        PopulateDefault().populate(
+          pospool=pospool, posmap={'RB': 1, 'FLEX': 1}, population_size=5, max_flex_redraws=3
+        )
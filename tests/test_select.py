@@ -26,5 +26,29 @@ def test_select_default(p, pop):
         newparams = {**params, **{'method': method}}
         newpop = SelectDefault().select(**newparams)
         assert isinstance(newpop, np.ndarray)
-        assert newpop.dtype == 'int64'
+        assert newpop.dtype == 'int32'
         assert len(newpop) == len(pop) // 2
+
+
+def test_select_tournament():
+    pop = np.arange(12).reshape(6, 2)
+    fitness = np.array([1., 3., 5., 2., 2., 0.])
+    newpop = SelectDefault().select(
+      population=pop, population_fitness=fitness, n=4, method='tournament',
+      tournament_size=50, rng=np.random.default_rng(0)
+    )
+    assert np.array_equal(newpop, pop[[2, 2, 2, 2]])
+
+
+def test_select_fittest():
+    pop = np.arange(12).reshape(6, 2)
+    fitness = np.array([1., 3., 5., 2., 4., 0.])
+    newpop = SelectDefault().select(population=pop, population_fitness=fitness, n=3, method='fittest')
+    assert sorted(map(tuple, newpop)) == [(2, 3), (4, 5), (8, 9)]
+
+
+@pytest.mark.parametrize('fitness', [[1., -3., 5.], [1., np.nan, 5.], [0., 0., 0.]])
+def test_select_roulette_invalid_fitness(fitness):
+    pop = np.arange(6).reshape(3, 2)
+    with pytest.raises(ValueError):
+        SelectDefault().select(population=pop, population_fitness=np.array(fitness), n=2, method='roulette')
@@ -0,0 +1,30 @@
+# pangadfs/tests/test_validate.py
+# -*- coding: utf-8 -*-
+# Copyright (C) 2020 Eric Truett
+# Licensed under the MIT License
+
+import numpy as np
+import pytest
+
+from pangadfs.validate import DuplicatesValidate, SalaryValidate
+
+
+def test_duplicates_validate():
+    population = np.array([
+        [1, 2, 3],
+        [3, 2, 1],
+        [4, 5, 6],
+        [4, 4, 6],
+        [6, 5, 4],
+        [7, 8, 9]
+    ], dtype=np.int32)
+    vpop = DuplicatesValidate().validate(population=population)
+    assert vpop.dtype == population.dtype
+    assert sorted(map(tuple, vpop)) == [(1, 2, 3), (4, 5, 6), (7, 8, 9)]
+
+
+def test_salary_validate():
+    population = np.array([[0, 1], [1, 2], [0, 2]], dtype=np.int32)
+    salaries = np.array([100, 200, 300], dtype=np.int32)
+    vpop = SalaryValidate().validate(population=population, salaries=salaries, salary_cap=400)
+    assert np.array_equal(vpop, population[[0, 2]])